@@ -18,22 +18,31 @@ Data Flow:
 """
 
 import asyncio
-import json
 import logging
-import base64
 import os
-import io
-import wave
-from typing import Optional, Dict, Any
+import re
+from collections import deque
+from contextlib import aclosing
+from functools import lru_cache
+from typing import AsyncIterator, Iterator, Optional, Dict, Any
+from urllib.parse import parse_qs, urlsplit
 import websockets
 import aiohttp
 import numpy as np
 import msgpack
+import orjson
 import socket
+import struct
+import time
 from aiohttp import TCPConnector
 from websockets.server import WebSocketServerProtocol
 from websockets.exceptions import ConnectionClosed, WebSocketException
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (e.g. not available on Windows)
+    uvloop = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -46,44 +55,360 @@ GROQ_API_KEY = os.environ.get("GROQ_API_KEY") or os.environ.get("OPENAI_API_KEY"
 GROQ_TTS_URL = os.environ.get("GROQ_TTS_URL", "https://api.groq.com/openai/v1/audio/speech")
 GROQ_TTS_MODEL = os.environ.get("GROQ_TTS_MODEL", "playai-tts")
 GROQ_TTS_VOICE = os.environ.get("GROQ_TTS_VOICE", "Ruby-PlayAI")
+# "pcm" asks Groq for headerless 16-bit PCM; falls back to "wav" if Groq rejects it
+GROQ_TTS_RESPONSE_FORMAT = os.environ.get("GROQ_TTS_RESPONSE_FORMAT", "wav")
+# Optional output rate to request from Groq; 24000 avoids resampling entirely.
+# Also the rate assumed for headerless PCM (Groq's default is 48000).
+GROQ_TTS_SAMPLE_RATE = int(os.environ.get("GROQ_TTS_SAMPLE_RATE", "0")) or None
 WS_PORT = int(os.environ.get("WS_PORT", "8080"))
+MAX_TTS_CHARS = int(os.environ.get("MAX_TTS_CHARS", "2000"))
+GROQ_STREAM_CHUNK_SIZE = int(os.environ.get("GROQ_STREAM_CHUNK_SIZE", "16384"))
+# Initial size of pooled WAV decode buffers (one network chunk plus leftovers)
+DECODE_BUFFER_SIZE = 2 * GROQ_STREAM_CHUNK_SIZE
+
+# Unmute expects 24 kHz mono float PCM
+TARGET_SR = 24000
+# Audio messages are sized in units of ~20ms at 24kHz (480 samples)
+AUDIO_CHUNK_SAMPLES = 480
+# Coalesce this many chunks into each Audio message to cut per-message framing
+# and syscall overhead; Unmute just sees a longer pcm list
+AUDIO_CHUNKS_PER_MESSAGE = int(os.environ.get("AUDIO_CHUNKS_PER_MESSAGE", "4"))
+AUDIO_MESSAGE_SAMPLES = AUDIO_CHUNK_SAMPLES * AUDIO_CHUNKS_PER_MESSAGE
+
+# Unmute's TTSAudioMessage carries a list of floats; "f32le" sends raw float32 bytes
+# instead, for clients that reinterpret the buffer themselves
+AUDIO_PCM_FORMAT = os.environ.get("AUDIO_PCM_FORMAT", "float_list")
+AUDIO_PCM_BINARY = AUDIO_PCM_FORMAT == "f32le"
+
+# WebSocket backpressure configuration
+WS_MAX_MESSAGE_SIZE = 65536  # inbound messages only carry text
+WS_MAX_QUEUE = 8
+WS_WRITE_LIMIT = 2 ** 20
+WS_SEND_TIMEOUT = float(os.environ.get("WS_SEND_TIMEOUT", "5.0"))
+# Frames a session may have queued for its writer task before synthesis waits
+WS_OUTBOX_SIZE = int(os.environ.get("WS_OUTBOX_SIZE", "32"))
 
 # Service discovery configuration
 MAX_CONCURRENT_SESSIONS = int(os.environ.get("MAX_CONCURRENT_SESSIONS", "10"))
+MAX_CONCURRENT_HANDSHAKES = int(os.environ.get("MAX_CONCURRENT_HANDSHAKES", "32"))
 STARTUP_TIMEOUT = float(os.environ.get("STARTUP_TIMEOUT", "5.0"))
+HEALTH_PROBE_INTERVAL = float(os.environ.get("HEALTH_PROBE_INTERVAL", "30.0"))
+# Fan audio out to every connection that joined the same ?group= (off by default)
+BROADCAST_GROUPS = os.environ.get("BROADCAST_GROUPS", "false").lower() in ("1", "true", "yes")
 
 # Validate configuration
 if not GROQ_API_KEY:
     logger.error("GROQ_API_KEY or OPENAI_API_KEY environment variable is required")
     exit(1)
 
+if AUDIO_CHUNKS_PER_MESSAGE <= 0:
+    logger.error(f"AUDIO_CHUNKS_PER_MESSAGE must be positive, got {AUDIO_CHUNKS_PER_MESSAGE}")
+    exit(1)
+
+if GROQ_TTS_RESPONSE_FORMAT not in ("wav", "pcm"):
+    logger.error(f"GROQ_TTS_RESPONSE_FORMAT must be 'wav' or 'pcm', got {GROQ_TTS_RESPONSE_FORMAT!r}")
+    exit(1)
+
+if AUDIO_PCM_FORMAT not in ("float_list", "f32le"):
+    logger.error(f"AUDIO_PCM_FORMAT must be 'float_list' or 'f32le', got {AUDIO_PCM_FORMAT!r}")
+    exit(1)
+
 logger.info(f"TTS Bridge v2 starting with model: {GROQ_TTS_MODEL}, voice: {GROQ_TTS_VOICE}")
 logger.info(f"Service capacity: {MAX_CONCURRENT_SESSIONS} concurrent sessions")
 
 
+# The Groq request body only varies in its input text, so serialize the rest once
+# per response format. WAV (or headerless PCM) is easy to turn into the float PCM
+# Unmute expects; Groq API expects 'response_format' (OpenAI-compatible).
+def _synth_payload_prefix(response_format: str) -> bytes:
+    fields = {
+        "model": GROQ_TTS_MODEL,
+        "voice": GROQ_TTS_VOICE,
+        "response_format": response_format,
+    }
+    if GROQ_TTS_SAMPLE_RATE:
+        fields["sample_rate"] = GROQ_TTS_SAMPLE_RATE
+    return orjson.dumps(fields)[:-1] + b',"input":'
+
+
+_SYNTH_PAYLOAD_PREFIXES = {fmt: _synth_payload_prefix(fmt) for fmt in ("wav", "pcm")}
+
+
+def synth_payload(text: str, response_format: str = "wav") -> bytes:
+    """Build the JSON body for a Groq speech request, escaping only the text."""
+    return _SYNTH_PAYLOAD_PREFIXES[response_format] + orjson.dumps(text) + b"}"
+
+
+# First non-whitespace character of a JSON object; matched without copying the message
+_JSON_OBJECT_START = re.compile(r"\s*\{")
+
+# Control messages are constant, so encode them once
+READY_MESSAGE = msgpack.packb({"type": "Ready"})
+CAPACITY_ERROR_MESSAGE = msgpack.packb({"type": "Error", "message": "Service at capacity"})
+
+# One long-lived Packer reuses its internal buffer instead of building a new one per
+# audio frame. Floats go out as float32 (samples are float32 already) and bytes as
+# msgpack bin. Only used from the event loop thread, so it is never shared concurrently.
+_PACKER = msgpack.Packer(use_bin_type=True, use_single_float=True)
+
+
+@lru_cache(maxsize=64)
+def pack_error(message: str) -> bytes:
+    """Encode an Error message; the bridge only sends a handful of distinct ones."""
+    return _PACKER.pack({"type": "Error", "message": message})
+
+
+def iter_audio_frames(pcm: np.ndarray) -> Iterator[bytes]:
+    """Yield pre-packed msgpack TTSAudioMessage frames for 24 kHz float32 PCM.
+
+    Each frame is a complete message of up to AUDIO_MESSAGE_SAMPLES samples;
+    Unmute decodes one msgpack object per WebSocket message.
+    """
+    if AUDIO_PCM_BINARY:
+        # Raw little-endian float32 bytes in a msgpack bin: 4 bytes per sample
+        # and no per-sample Python floats
+        pcm = np.ascontiguousarray(pcm, dtype='<f4')
+    
+    # Whole frames are rows of a (frames, samples) view; only the tail is sliced
+    n_full = pcm.shape[0] // AUDIO_MESSAGE_SAMPLES
+    split = n_full * AUDIO_MESSAGE_SAMPLES
+    blocks = pcm[:split].reshape(n_full, AUDIO_MESSAGE_SAMPLES)
+    tail = pcm[split:]
+    
+    if AUDIO_PCM_BINARY:
+        for row in blocks:
+            yield _PACKER.pack({"type": "Audio", "pcm": row.tobytes()})
+        if tail.size:
+            yield _PACKER.pack({"type": "Audio", "pcm": tail.tobytes()})
+    else:
+        # Samples are packed as msgpack float32 instead of float64,
+        # cutting audio bytes on the wire from 9 to 5 per sample
+        for row in blocks.tolist():
+            yield _PACKER.pack({"type": "Audio", "pcm": row})
+        if tail.size:
+            yield _PACKER.pack({"type": "Audio", "pcm": tail.tolist()})
+
+
+# Scale from 16-bit integer samples to [-1, 1]
+PCM16_SCALE = np.float32(1.0 / 32768.0)
+
+
+class WavStreamDecoder:
+    """Incrementally decode a 16-bit PCM WAV byte stream into 24 kHz float32 mono PCM.
+
+    The RIFF header is parsed once enough bytes have arrived; every call to
+    ``feed`` then returns the samples that are complete so far. Resampling is
+    linear interpolation carried across chunk boundaries. A stream that does
+    not start with ``RIFF`` is read as headerless 16-bit mono PCM at
+    ``raw_sample_rate``, if one is given.
+
+    Incoming bytes are staged in ``buffer``, which is only ever grown, never
+    shrunk, so a pooled buffer can be handed from one utterance to the next.
+    """
+    
+    # Give up if no data chunk shows up within this many header bytes
+    MAX_HEADER_BYTES = 4096
+    # fmt chunk format tags; extensible WAVs carry the real tag in their SubFormat GUID
+    WAVE_FORMAT_PCM = 0x0001
+    WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+    
+    def __init__(self, target_sr: int = TARGET_SR, buffer: Optional[bytearray] = None,
+                 raw_sample_rate: Optional[int] = None):
+        self.target_sr = target_sr
+        self.raw_sample_rate = raw_sample_rate
+        self.sample_rate: Optional[int] = None
+        self.n_channels = 1
+        self.buffer = buffer if buffer is not None else bytearray(DECODE_BUFFER_SIZE)
+        self._fill = 0
+        self._header_parsed = False
+        # Resampler state: next output position relative to the last input sample
+        self._resample_pos = 0.0
+        self._last_sample: Optional[np.float32] = None
+    
+    def _parse_header(self) -> bool:
+        """Parse the RIFF header from the pending bytes. Returns False if more data is needed."""
+        if self._fill < 4:
+            return False
+        if self.raw_sample_rate and self.buffer[:4] != b"RIFF":
+            # Headerless PCM: nothing to parse or skip
+            self.sample_rate = self.raw_sample_rate
+            self.n_channels = 1
+            self._header_parsed = True
+            return True
+        
+        # Walk the RIFF chunks in place with struct instead of copying the
+        # header into BytesIO for the wave module
+        if self._fill < 12:
+            return False
+        riff_id, _, wave_id = struct.unpack_from('<4sI4s', self.buffer, 0)
+        if riff_id != b"RIFF" or wave_id != b"WAVE":
+            raise ValueError("Audio stream is not RIFF/WAVE")
+        
+        offset = 12
+        sampwidth = None
+        while True:
+            if offset + 8 > self._fill:
+                return self._need_more_header()
+            chunk_id, chunk_size = struct.unpack_from('<4sI', self.buffer, offset)
+            offset += 8
+            if chunk_id == b"data":
+                # Streamed WAVs may carry a placeholder size; read to end of stream
+                break
+            if offset + chunk_size > self._fill:
+                return self._need_more_header()
+            if chunk_id == b"fmt ":
+                format_tag, self.n_channels, self.sample_rate, _, _, bits = struct.unpack_from(
+                    '<HHIIHH', self.buffer, offset
+                )
+                if format_tag == self.WAVE_FORMAT_EXTENSIBLE and chunk_size >= 40:
+                    format_tag, = struct.unpack_from('<H', self.buffer, offset + 24)
+                if format_tag != self.WAVE_FORMAT_PCM:
+                    raise ValueError(f"Unsupported WAV format tag {format_tag:#06x}; only PCM is decoded")
+                sampwidth = bits // 8
+            # Chunks are word-aligned
+            offset += chunk_size + (chunk_size & 1)
+        
+        if sampwidth is None:
+            raise ValueError("WAV data chunk precedes fmt chunk")
+        data_offset = offset
+        
+        if sampwidth != 2:
+            logger.warning(f"Unexpected sample width {sampwidth*8} bits; attempting to decode as 16-bit")
+        if self.sample_rate != self.target_sr:
+            logger.debug("Resampling TTS audio from %d Hz to %d Hz", self.sample_rate, self.target_sr)
+        self._consume(data_offset)
+        self._header_parsed = True
+        return True
+    
+    def _need_more_header(self) -> bool:
+        """Wait for more header bytes, unless the header is implausibly long."""
+        if self._fill > self.MAX_HEADER_BYTES:
+            raise ValueError(f"No WAV data chunk within {self.MAX_HEADER_BYTES} bytes")
+        return False
+    
+    def _append(self, data: bytes):
+        """Copy data into the staging buffer, growing it only when it is too small."""
+        end = self._fill + len(data)
+        if end > len(self.buffer):
+            self.buffer.extend(bytes(end - len(self.buffer)))
+        self.buffer[self._fill:end] = data
+        self._fill = end
+    
+    def _consume(self, n: int):
+        """Drop the first n staged bytes, moving the remainder to the front."""
+        remaining = self._fill - n
+        if remaining > 0:
+            self.buffer[:remaining] = self.buffer[n:self._fill]
+        self._fill = remaining
+    
+    def _resample(self, pcm: np.ndarray) -> np.ndarray:
+        """Linearly resample a block of PCM, continuing from the previous block."""
+        step = self.sample_rate / float(self.target_sr)
+        if self._last_sample is not None:
+            pcm = np.concatenate(([self._last_sample], pcm))
+        last_index = pcm.size - 1
+        if last_index < self._resample_pos:
+            n_out = 0
+        else:
+            n_out = int((last_index - self._resample_pos) // step) + 1
+        positions = self._resample_pos + step * np.arange(n_out)
+        out = np.interp(positions, np.arange(pcm.size), pcm).astype(np.float32)
+        self._resample_pos += step * n_out - last_index
+        self._last_sample = pcm[-1]
+        return out
+    
+    def feed(self, data: bytes) -> np.ndarray:
+        """Add WAV bytes and return the newly decoded samples (possibly empty)."""
+        self._append(data)
+        if not self._header_parsed and not self._parse_header():
+            return np.empty(0, dtype=np.float32)
+        
+        frame_bytes = 2 * self.n_channels
+        usable = self._fill - self._fill % frame_bytes
+        if usable == 0:
+            return np.empty(0, dtype=np.float32)
+        samples = np.frombuffer(self.buffer, dtype='<i2', count=usable // 2)
+        if self.n_channels > 1:
+            # Downmix straight from int16 with a float32 accumulator (no float64 upcast)
+            pcm = samples.reshape(-1, self.n_channels).mean(axis=1, dtype=np.float32)
+            pcm *= PCM16_SCALE
+        else:
+            # Convert and normalize to [-1, 1] in one vectorized pass, no float32 temporary
+            pcm = np.multiply(samples, PCM16_SCALE, dtype=np.float32)
+        # Release the view on the staging buffer before it is modified
+        del samples
+        self._consume(usable)
+        
+        if self.sample_rate != self.target_sr:
+            pcm = self._resample(pcm)
+        return pcm
+
+
+class SlowClientError(Exception):
+    """Raised once a client that stopped draining its socket has been dropped."""
+
+
+class SynthesisError(Exception):
+    """Raised when the Groq request or response body fails before it completes."""
+
+
 class TTSBridge:
     """Text-to-Speech WebSocket bridge implementing ServiceWithStartup protocol."""
     
     def __init__(self):
         self.session: Optional[aiohttp.ClientSession] = None
+        self._connector: Optional[TCPConnector] = None
+        # Built once and shared by every Groq request
+        self._response_format = GROQ_TTS_RESPONSE_FORMAT
+        self._headers = {
+            "Authorization": f"Bearer {GROQ_API_KEY}",
+            "Content-Type": "application/json"
+        }
         self.connection_count = 0
         self.active_sessions = 0
+        # Session slots; claimed at connect time so bursts cannot exceed the cap
+        self._session_slots = asyncio.Semaphore(MAX_CONCURRENT_SESSIONS)
+        self._handshake_slots = asyncio.Semaphore(MAX_CONCURRENT_HANDSHAKES)
         self.is_running = True
+        # Cached Groq availability, refreshed by _health_loop and successful
+        # synthesis instead of per connection; _api_ok_ts is the last success
+        self._api_ok: bool = True
+        self._api_ok_ts: float = float("-inf")  # Never, so the first loop pass probes
+        # Decode buffers reused across utterances instead of regrown for each one
+        self._buffer_pool: deque[bytearray] = deque()
+        # Broadcast groups: group name -> connections, and connection -> group name
+        self._subscribers: Dict[str, set[WebSocketServerProtocol]] = {}
+        self._groups: Dict[WebSocketServerProtocol, str] = {}
+        # Per-connection outbound queues and the writer tasks draining them
+        self._outboxes: Dict[WebSocketServerProtocol, asyncio.Queue] = {}
+        self._writers: Dict[WebSocketServerProtocol, asyncio.Task] = {}
+        # Connections already warned about a backed-up write buffer
+        self._lagging: set[WebSocketServerProtocol] = set()
     
     async def start_session(self):
         """Initialize HTTP session for Groq API calls."""
         if not self.session:
             timeout = aiohttp.ClientTimeout(total=30)
-            # Force IPv4-only connections to prevent IPv6 connectivity issues
-            connector = TCPConnector(family=socket.AF_INET)
-            self.session = aiohttp.ClientSession(timeout=timeout, connector=connector)
-            logger.info("HTTP session initialized for Groq API with IPv4-only connections")
+            # Force IPv4-only connections to prevent IPv6 connectivity issues.
+            # Pool and keep connections alive so TLS handshakes to Groq are amortized.
+            self._connector = TCPConnector(
+                family=socket.AF_INET,
+                limit=MAX_CONCURRENT_SESSIONS * 2,
+                limit_per_host=MAX_CONCURRENT_SESSIONS * 2,
+                ttl_dns_cache=600,
+                keepalive_timeout=300,
+                # Abort TLS transports that never finish closing instead of leaking them
+                enable_cleanup_closed=True,
+            )
+            self.session = aiohttp.ClientSession(timeout=timeout, connector=self._connector)
+            logger.info("HTTP session initialized for Groq API with IPv4-only pooled connections")
     
     async def close_session(self):
         """Close HTTP session."""
         if self.session:
             await self.session.close()
             self.session = None
+            self._connector = None
             logger.info("HTTP session closed")
     
     async def test_groq_api(self) -> bool:
@@ -93,33 +418,20 @@ class TTSBridge:
         Returns:
             True if API is available, False otherwise
         """
-        if not self.session:
-            await self.start_session()
-        
         # Test with minimal request
-        payload = {
-            "model": GROQ_TTS_MODEL,
-            "input": "test",
-            "voice": GROQ_TTS_VOICE,
-            "response_format": "wav"
-        }
-        
-        headers = {
-            "Authorization": f"Bearer {GROQ_API_KEY}",
-            "Content-Type": "application/json"
-        }
-        
         try:
             logger.debug("Testing Groq TTS API availability...")
             async with self.session.post(
                 GROQ_TTS_URL, 
-                json=payload, 
-                headers=headers
+                data=synth_payload("test"), 
+                headers=self._headers
             ) as response:
                 if response.status == 200:
-                    # Consume response to avoid connection issues
-                    await response.read()
-                    logger.info("Groq TTS API test successful")
+                    # Drain the probe audio so the keep-alive connection returns to
+                    # the pool, without joining the body into one bytes object
+                    async for _ in response.content.iter_chunked(GROQ_STREAM_CHUNK_SIZE):
+                        pass
+                    logger.debug("Groq TTS API test successful")
                     return True
                 else:
                     logger.error(f"Groq TTS API test failed: {response.status}")
@@ -129,117 +441,133 @@ class TTSBridge:
             logger.error(f"Groq TTS API test error: {e}")
             return False
     
-    async def synthesize_text(self, text: str) -> Optional[bytes]:
+    def _acquire_buffer(self) -> bytearray:
+        """Take a decode buffer from the pool, allocating one if the pool is empty."""
+        if self._buffer_pool:
+            return self._buffer_pool.pop()
+        return bytearray(DECODE_BUFFER_SIZE)
+    
+    def _release_buffer(self, buffer: bytearray):
+        """Return a decode buffer to the pool; the pool never holds more than one per session."""
+        if len(self._buffer_pool) < MAX_CONCURRENT_SESSIONS:
+            self._buffer_pool.append(buffer)
+    
+    def _subscribe(self, websocket: WebSocketServerProtocol, path: str):
+        """Join the broadcast group named by the ?group= query parameter, if any."""
+        group = parse_qs(urlsplit(path).query).get("group", [None])[0]
+        if group:
+            self._subscribers.setdefault(group, set()).add(websocket)
+            self._groups[websocket] = group
+            logger.info(f"Joined broadcast group '{group}' ({len(self._subscribers[group])} subscribers)")
+    
+    def _unsubscribe(self, websocket: WebSocketServerProtocol):
+        """Leave the connection's broadcast group, dropping the group once empty."""
+        group = self._groups.pop(websocket, None)
+        if group is not None:
+            subscribers = self._subscribers[group]
+            subscribers.discard(websocket)
+            if not subscribers:
+                del self._subscribers[group]
+    
+    def _subscriber_group(self, websocket: WebSocketServerProtocol) -> Optional[set[WebSocketServerProtocol]]:
+        """Return the connections sharing this connection's broadcast group, if it has one."""
+        group = self._groups.get(websocket)
+        return self._subscribers.get(group) if group is not None else None
+    
+    def _set_api_ok(self, api_ok: bool):
+        """Update the cached Groq availability; successes also refresh its timestamp."""
+        if api_ok != self._api_ok:
+            logger.warning(f"Groq TTS API availability changed: {'up' if api_ok else 'down'}")
+        self._api_ok = api_ok
+        if api_ok:
+            self._api_ok_ts = time.monotonic()
+    
+    async def _health_loop(self):
+        """Periodically probe the Groq TTS API and cache the result for startup handshakes.
+
+        A successful synthesis already proves Groq is reachable, so the probe only
+        spends a request when there has been no successful traffic for an interval.
+        """
+        while self.is_running:
+            if time.monotonic() - self._api_ok_ts >= HEALTH_PROBE_INTERVAL:
+                self._set_api_ok(await self.test_groq_api())
+            await asyncio.sleep(HEALTH_PROBE_INTERVAL)
+    
+    async def synthesize_text_stream(self, text: str) -> AsyncIterator[bytes]:
         """
-        Call Groq TTS API to synthesize text into audio.
+        Call Groq TTS API and yield the audio body as it arrives.
         
         Args:
             text: Text to synthesize
             
-        Returns:
-            Audio bytes or None if failed
+        Yields:
+            WAV or headerless PCM bytes in network-sized chunks; nothing if Groq
+            rejected the request
+            
+        Raises:
+            SynthesisError: The request or the response body failed partway
         """
-        if not self.session:
-            await self.start_session()
-        
-        payload = {
-            "model": GROQ_TTS_MODEL,
-            "input": text,
-            "voice": GROQ_TTS_VOICE,
-            # Request WAV to easily extract PCM for Unmute (msgpack floats)
-            # Groq API expects 'response_format' (OpenAI-compatible)
-            "response_format": "wav"
-        }
-        
-        headers = {
-            "Authorization": f"Bearer {GROQ_API_KEY}",
-            "Content-Type": "application/json"
-        }
-        
         try:
-            text_preview = text[:50] + ('...' if len(text) > 50 else '')
-            logger.info(f"Synthesizing text: '{text_preview}'")
+            # Per-message logging stays off the hot path unless debugging
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Synthesizing %d chars: %r", len(text), text[:50])
             
-            async with self.session.post(
-                GROQ_TTS_URL, 
-                json=payload, 
-                headers=headers
-            ) as response:
-                if response.status == 200:
-                    audio_data = await response.read()
-                    logger.info(f"TTS success: {len(audio_data)} bytes audio generated")
-                    return audio_data
-                else:
-                    error_text = await response.text()
-                    logger.error(f"Groq TTS API error {response.status}: {error_text}")
-                    return None
+            while True:
+                response_format = self._response_format
+                async with self.session.post(
+                    GROQ_TTS_URL, 
+                    data=synth_payload(text, response_format), 
+                    headers=self._headers
+                ) as response:
+                    if response.status != 200:
+                        error_text = await response.text()
+                        if (response.status == 400 and response_format != "wav"
+                                and "response_format" in error_text):
+                            # Groq rejected the format itself (not the input): fall back
+                            # to WAV for this and every later request
+                            logger.warning(f"Groq rejected response_format={response_format!r}, falling back to wav: {error_text}")
+                            self._response_format = "wav"
+                            continue
+                        logger.error(f"Groq TTS API error {response.status}: {error_text}")
+                        return
+                    self._set_api_ok(True)
                     
-        except asyncio.TimeoutError:
+                    # Forward the body chunk by chunk instead of buffering it all with read()
+                    received = 0
+                    async for chunk in response.content.iter_chunked(GROQ_STREAM_CHUNK_SIZE):
+                        received += len(chunk)
+                        yield chunk
+                    logger.debug("TTS success: %d bytes audio streamed", received)
+                    return
+                    
+        except asyncio.TimeoutError as e:
             logger.error("Groq TTS API timeout")
-            return None
+            raise SynthesisError("Groq TTS API timeout") from e
         except Exception as e:
             logger.error(f"TTS API call failed: {e}")
-            return None
+            raise SynthesisError(str(e)) from e
     
-    def wav_bytes_to_pcm_f32(self, wav_bytes: bytes) -> tuple[np.ndarray, int]:
-        """Convert 16-bit PCM WAV bytes to float32 mono PCM in [-1, 1].
-
-        Returns (pcm, sample_rate)
-        """
-        with wave.open(io.BytesIO(wav_bytes), 'rb') as wf:
-            n_channels = wf.getnchannels()
-            sampwidth = wf.getsampwidth()
-            framerate = wf.getframerate()
-            n_frames = wf.getnframes()
-            raw = wf.readframes(n_frames)
-
-        if sampwidth != 2:
-            logger.warning(f"Unexpected sample width {sampwidth*8} bits; attempting to decode as 16-bit")
-        pcm = np.frombuffer(raw, dtype='<i2').astype(np.float32)
-        if n_channels > 1:
-            pcm = pcm.reshape(-1, n_channels).mean(axis=1)
-        # Normalize to [-1, 1]
-        pcm = pcm / 32768.0
-        return pcm, framerate
-
-    async def stream_audio_chunks(self, websocket: WebSocketServerProtocol, audio_data: bytes):
-        """Stream audio as msgpack TTSAudioMessage frames (floats).
+    async def stream_audio_chunks(self, websocket: WebSocketServerProtocol, pcm: np.ndarray) -> int:
+        """Stream 24 kHz float32 PCM as msgpack TTSAudioMessage frames (floats).
 
-        Ensures 24 kHz PCM by resampling if needed.
+        Frames are queued as fast as the connection's writer drains them;
+        Unmute buffers playback, and the bounded outbox applies backpressure
+        from this connection's socket. With broadcast groups enabled, frames
+        also go to every other connection in the sender's group at the
+        sender's pace; those get no backpressure of their own, and one whose
+        write buffer passes WS_WRITE_LIMIT is dropped. Returns the number of
+        frames sent.
         """
-        try:
-            pcm, sr = self.wav_bytes_to_pcm_f32(audio_data)
-        except Exception as e:
-            logger.error(f"Failed to parse WAV: {e}")
-            return
-
-        # Resample to 24 kHz if necessary (naive linear interpolation)
-        TARGET_SR = 24000
-        if sr != TARGET_SR and pcm.size > 0:
-            try:
-                import numpy as _np
-                x_old = _np.linspace(0.0, 1.0, pcm.size, endpoint=False)
-                new_size = int(round(pcm.size * (TARGET_SR / float(sr))))
-                x_new = _np.linspace(0.0, 1.0, new_size, endpoint=False)
-                pcm = _np.interp(x_new, x_old, pcm).astype(_np.float32)
-                logger.info(f"Resampled TTS audio from {sr} Hz to {TARGET_SR} Hz ({pcm.size} samples)")
-            except Exception as e:
-                logger.warning(f"Resample failed ({sr} -> {TARGET_SR}), streaming original SR: {e}")
-
-        # Chunk into ~20ms at 24kHz (480 samples) for smoother streaming
-        CHUNK = 480  # Reduced from 1920 for smoother audio
-        total = pcm.shape[0]
-        sent = 0
-        while sent < total:
-            chunk = pcm[sent:sent+CHUNK]
-            if chunk.size == 0:
-                break
-            payload = {"type": "Audio", "pcm": chunk.tolist()}
-            await websocket.send(msgpack.packb(payload))
-            sent += chunk.size
-            # Faster pacing for smoother audio (20ms instead of 80ms)
-            await asyncio.sleep(0.02)
-        logger.info(f"Streamed {sent} samples as msgpack TTSAudioMessage")
+        group = self._subscriber_group(websocket)
+        frames = 0
+        for frame in iter_audio_frames(pcm):
+            if group is not None and len(group) > 1:
+                # Encoded once, written to every subscriber without awaiting each one
+                await self._send(websocket, frame, group)
+            else:
+                await self._send(websocket, frame)
+            frames += 1
+        return frames
     
     async def handle_text_message(self, websocket: WebSocketServerProtocol, message_data: Dict[str, Any]):
         """
@@ -249,40 +577,204 @@ class TTSBridge:
             websocket: WebSocket connection
             message_data: Parsed JSON message
         """
-        text = message_data.get("text", "").strip()
+        text = message_data.get("text")
         
-        if not text:
+        # Validate without copying: isspace() scans in place where strip() would allocate
+        if not isinstance(text, str) or not text or text.isspace():
             logger.warning("Received empty text for synthesis")
             await self.send_error(websocket, "Empty text provided")
             return
         
-        # Call Groq TTS API
-        audio_data = await self.synthesize_text(text)
+        # Reject oversize input before spending a Groq round-trip on it
+        if len(text) > MAX_TTS_CHARS:
+            logger.warning(f"Received {len(text)} chars for synthesis, limit is {MAX_TTS_CHARS}")
+            await self.send_error(websocket, f"Text exceeds {MAX_TTS_CHARS} characters")
+            return
+        
+        # Call Groq TTS API and stream audio back as it arrives. Only full-size messages
+        # are sent while the response is streaming; the remainder is carried over
+        # to the next network chunk and flushed once the response is complete.
+        raw_sample_rate = (GROQ_TTS_SAMPLE_RATE or 48000) if self._response_format == "pcm" else None
+        decoder = WavStreamDecoder(buffer=self._acquire_buffer(), raw_sample_rate=raw_sample_rate)
+        carry = np.empty(0, dtype=np.float32)
+        received = False
+        samples = 0
+        frames = 0
+        try:
+            async with aclosing(self.synthesize_text_stream(text)) as audio_stream:
+                async for audio_data in audio_stream:
+                    received = True
+                    try:
+                        # Chunks are at most GROQ_STREAM_CHUNK_SIZE bytes, which decode in
+                        # ~0.1 ms; a worker-thread hop would cost about half that again
+                        pcm = decoder.feed(audio_data)
+                    except Exception as e:
+                        logger.error(f"Failed to parse WAV: {e}")
+                        await self.send_error(websocket, "TTS synthesis failed")
+                        return
+                    # Don't pin the network chunk while its frames are queued
+                    del audio_data
+                    if carry.size > 0:
+                        pcm = np.concatenate((carry, pcm))
+                    n_whole = pcm.size - pcm.size % AUDIO_MESSAGE_SAMPLES
+                    if n_whole > 0:
+                        frames += await self.stream_audio_chunks(websocket, pcm[:n_whole])
+                        samples += n_whole
+                    # Copy the short remainder; a view would keep the whole block alive
+                    carry = pcm[n_whole:].copy()
+                    del pcm
+        except SynthesisError:
+            # The response broke off; tell the client its audio is incomplete
+            await self.send_error(websocket, "TTS synthesis failed")
+            return
+        finally:
+            self._release_buffer(decoder.buffer)
+        
+        if carry.size > 0:
+            frames += await self.stream_audio_chunks(websocket, carry)
+            samples += carry.size
         
-        if audio_data:
-            # Stream audio back to client using msgpack TTSAudioMessage
-            await self.stream_audio_chunks(websocket, audio_data)
+        if received:
+            logger.debug("Streamed %d samples in %d msgpack TTSAudioMessage frames", samples, frames)
         else:
             await self.send_error(websocket, "TTS synthesis failed")
     
+    def _start_writer(self, websocket: WebSocketServerProtocol):
+        """Give the connection an outbox and a task that writes it to the socket."""
+        outbox: asyncio.Queue = asyncio.Queue(maxsize=WS_OUTBOX_SIZE)
+        self._outboxes[websocket] = outbox
+        self._writers[websocket] = asyncio.create_task(self._writer(websocket, outbox))
+    
+    async def _stop_writer(self, websocket: WebSocketServerProtocol):
+        """Cancel the connection's writer task and drop its outbox."""
+        self._outboxes.pop(websocket, None)
+        writer = self._writers.pop(websocket, None)
+        if writer is None:
+            return
+        writer.cancel()
+        # asyncio.wait() doesn't raise the writer's outcome, so a cancellation of
+        # this handler still propagates while the writer's own is not reported
+        await asyncio.wait({writer})
+        if not writer.cancelled():
+            writer.exception()  # Mark retrieved; the message loop already handled it
+    
+    async def _writer(self, websocket: WebSocketServerProtocol, outbox: asyncio.Queue):
+        """Drain the outbox in order, so synthesis never waits on the socket directly.
+
+        Each item is (frame, targets): targets is None for this connection
+        alone, or a broadcast group the frame is written to.
+        """
+        while True:
+            data, targets = await outbox.get()
+            if targets is None:
+                await self._write(websocket, data)
+            else:
+                await self._write_group(websocket, targets, data)
+    
+    async def _write(self, websocket: WebSocketServerProtocol, data: bytes):
+        """Send a frame, dropping the connection if the client stops draining its socket."""
+        # Warn once per connection rather than on every frame while it lags
+        if websocket not in self._lagging:
+            buffered = websocket.transport.get_write_buffer_size()
+            if buffered > WS_WRITE_LIMIT // 2:
+                self._lagging.add(websocket)
+                logger.warning(f"Slow client: {buffered} bytes waiting in write buffer")
+        try:
+            await asyncio.wait_for(websocket.send(data), timeout=WS_SEND_TIMEOUT)
+        except asyncio.TimeoutError:
+            self._drop_slow_client(websocket, f"Send blocked for more than {WS_SEND_TIMEOUT}s")
+    
+    async def _write_group(self, websocket: WebSocketServerProtocol,
+                           targets: set[WebSocketServerProtocol], data: bytes):
+        """Write a frame to websocket with backpressure and to the rest of its group without.
+
+        broadcast() never waits on a socket, so a group member that falls
+        behind would buffer the whole utterance; members already past
+        WS_WRITE_LIMIT are dropped instead of written to.
+        """
+        others = []
+        for member in targets:
+            if member is websocket:
+                continue
+            if member.transport.get_write_buffer_size() > WS_WRITE_LIMIT:
+                logger.warning(f"Group member write buffer past {WS_WRITE_LIMIT} bytes; dropping slow connection")
+                member.transport.abort()
+            else:
+                others.append(member)
+        websockets.broadcast(others, data)
+        await self._write(websocket, data)
+    
+    def _drop_slow_client(self, websocket: WebSocketServerProtocol, reason: str):
+        """Abort a connection whose client stopped reading and raise SlowClientError.
+
+        A closing handshake would wait on the same unread socket through the
+        close timeouts, holding the session slot and the Groq response; the
+        transport is aborted instead.
+        """
+        logger.warning(f"{reason}; dropping slow connection")
+        websocket.transport.abort()
+        raise SlowClientError(reason)
+    
+    async def _send(self, websocket: WebSocketServerProtocol, data: bytes,
+                    targets: Optional[set[WebSocketServerProtocol]] = None):
+        """Queue a frame for the connection's writer, or send it inline before one exists.
+
+        Args:
+            websocket: Connection whose outbox (and send order) the frame joins
+            data: Encoded frame
+            targets: Broadcast group to write the frame to instead of websocket alone
+        """
+        outbox = self._outboxes.get(websocket)
+        if outbox is None:
+            if targets is None:
+                await self._write(websocket, data)
+            else:
+                await self._write_group(websocket, targets, data)
+            return
+        
+        writer = self._writers[websocket]
+        if writer.done():
+            # Re-raise why the writer stopped (connection closed or slow client)
+            writer.result()
+        try:
+            outbox.put_nowait((data, targets))
+            return
+        except asyncio.QueueFull:
+            pass
+        
+        # Outbox full: wait for room, but stop as soon as the writer gives up
+        put = asyncio.ensure_future(outbox.put((data, targets)))
+        try:
+            done, _ = await asyncio.wait(
+                {put, writer}, timeout=WS_SEND_TIMEOUT, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            put.cancel()
+        if put in done:
+            return
+        if writer.done():
+            writer.result()
+        self._drop_slow_client(websocket, f"Outbox full for more than {WS_SEND_TIMEOUT}s")
+    
     async def send_error(self, websocket: WebSocketServerProtocol, message: str):
         """Send error response to client as msgpack with expected schema."""
-        error_response = {"type": "Error", "message": message}
         try:
-            await websocket.send(msgpack.packb(error_response))
-            logger.info(f"Sent error: {message}")
+            await self._send(websocket, pack_error(message))
+            logger.info("Sent error: %s", message)
+        except SlowClientError:
+            # The connection is already gone; let the message loop end
+            raise
         except Exception as e:
             logger.error(f"Failed to send error message: {e}")
     
     async def send_ready_message(self, websocket: WebSocketServerProtocol):
         """Send msgpack Ready for ServiceWithStartup (Unmute expects msgpack)."""
-        await websocket.send(msgpack.packb({"type": "Ready"}))
+        await self._send(websocket, READY_MESSAGE)
         logger.info("Sent msgpack Ready to Unmute")
     
     async def send_capacity_error(self, websocket: WebSocketServerProtocol):
         """Send capacity error for ServiceWithStartup protocol."""
-        error_message = {"type": "Error", "message": "Service at capacity"}
-        await websocket.send(msgpack.packb(error_message))
+        await self._send(websocket, CAPACITY_ERROR_MESSAGE)
         logger.warning(f"Sent capacity error - active sessions: {self.active_sessions}/{MAX_CONCURRENT_SESSIONS}")
     
     async def handle_websocket_connection(self, websocket: WebSocketServerProtocol, path: str):
@@ -299,29 +791,40 @@ class TTSBridge:
         
         logger.info(f"TTS WebSocket connection #{connection_id} from {client_info}")
         
+        slot_acquired = False
         try:
-            # Implement ServiceWithStartup protocol
-            if self.active_sessions >= MAX_CONCURRENT_SESSIONS:
-                logger.warning(f"TTS service at capacity: {self.active_sessions}/{MAX_CONCURRENT_SESSIONS}")
-                await self.send_capacity_error(websocket)
-                return
-            
-            if not self.is_running:
-                logger.error("TTS service not available")
-                await self.send_error(websocket, "Service unavailable")
-                return
-            
-            # Test Groq API availability before confirming ready
-            if not await self.test_groq_api():
-                logger.error("Groq TTS API not available")
-                await self.send_error(websocket, "TTS API unavailable")
-                return
+            # Limit how many connections run the startup handshake at once, so an
+            # accept storm queues here; the slot is released before the message loop.
+            async with self._handshake_slots:
+                # Implement ServiceWithStartup protocol. The locked() check and the
+                # acquire() below run without yielding to the event loop, so no other
+                # connection can take the last slot in between.
+                if self._session_slots.locked():
+                    logger.warning(f"TTS service at capacity: {self.active_sessions}/{MAX_CONCURRENT_SESSIONS}")
+                    await self.send_capacity_error(websocket)
+                    return
+                await self._session_slots.acquire()
+                slot_acquired = True
+                self.active_sessions += 1
+                
+                if not self.is_running:
+                    logger.error("TTS service not available")
+                    await self.send_error(websocket, "Service unavailable")
+                    return
+                
+                # Consult the cached Groq probe result before confirming ready
+                if not self._api_ok:
+                    logger.error("Groq TTS API not available")
+                    await self.send_error(websocket, "TTS API unavailable")
+                    return
+                
+                # Send Ready in msgpack to complete startup handshake
+                await self.send_ready_message(websocket)
             
-            # Send Ready in msgpack to complete startup handshake
-            await self.send_ready_message(websocket)
+            self._start_writer(websocket)
+            if BROADCAST_GROUPS:
+                self._subscribe(websocket, path)
             
-            # Increment active session count
-            self.active_sessions += 1
             logger.info(f"TTS session #{connection_id} started - active: {self.active_sessions}/{MAX_CONCURRENT_SESSIONS}")
             
             # Handle TTS requests
@@ -334,14 +837,19 @@ class TTSBridge:
                         if mtype == "Text":
                             await self.handle_text_message(websocket, data)
                         elif mtype == "Eos":
-                            logger.info("Received Eos; no more text to synthesize")
+                            logger.debug("Received Eos; no more text to synthesize")
                         else:
                             logger.warning(f"Unknown msgpack message type: {mtype}")
                             await self.send_error(websocket, "Invalid message format")
                     elif isinstance(message, str):
-                        # Fallback: accept simple JSON for manual tests
-                        message_data = json.loads(message)
-                        if "text" in message_data:
+                        # Fallback: accept simple JSON for manual tests. Anything that is
+                        # not an object mentioning "text" is rejected without decoding.
+                        if not _JSON_OBJECT_START.match(message) or '"text"' not in message:
+                            logger.warning("Rejected non-text JSON message")
+                            await self.send_error(websocket, "Invalid message format")
+                            continue
+                        message_data = orjson.loads(message)
+                        if isinstance(message_data, dict) and "text" in message_data:
                             await self.handle_text_message(websocket, message_data)
                         else:
                             logger.warning(f"Unknown JSON message: {message_data}")
@@ -349,44 +857,60 @@ class TTSBridge:
                     else:
                         logger.warning(f"Unsupported message type: {type(message)}")
                         await self.send_error(websocket, "Invalid message type")
+                except orjson.JSONDecodeError as e:
+                    logger.warning(f"Invalid JSON message: {e}")
+                    await self.send_error(websocket, "Invalid message format")
+                except (ConnectionClosed, SlowClientError):
+                    # Writing to this client failed for good; no error frame can follow
+                    raise
                 except Exception as e:
                     logger.error(f"Message handling error: {e}")
                     await self.send_error(websocket, "Message processing failed")
                     
         except ConnectionClosed:
             logger.info(f"TTS WebSocket connection #{connection_id} closed by client")
+        except SlowClientError:
+            logger.warning(f"TTS WebSocket connection #{connection_id} dropped: client too slow")
         except WebSocketException as e:
             logger.error(f"WebSocket error on connection #{connection_id}: {e}")
         except Exception as e:
             logger.error(f"Unexpected error on connection #{connection_id}: {e}")
         finally:
-            # Decrement active session count
-            if self.active_sessions > 0:
+            self._unsubscribe(websocket)
+            await self._stop_writer(websocket)
+            self._lagging.discard(websocket)
+            # Release the session slot if this connection claimed one
+            if slot_acquired:
                 self.active_sessions -= 1
+                self._session_slots.release()
             logger.info(f"TTS WebSocket connection #{connection_id} ended - active: {self.active_sessions}/{MAX_CONCURRENT_SESSIONS}")
 
 
+# Health response is static, so it is encoded once at import
+_HEALTH_BODY = orjson.dumps({
+    "status": "ok",
+    "service": "tts-ws-groq-proxy-v2",
+    "version": "v2.0.0",
+    "protocol": "ServiceWithStartup"
+})
+_HEALTH_RESPONSE = (
+    200,
+    [
+        ("Content-Type", "application/json"),
+        ("Content-Length", str(len(_HEALTH_BODY))),
+    ],
+    _HEALTH_BODY,
+)
+
+
 async def health_check_handler(path, request_headers):
     """
     Handle HTTP health check requests.
     Returns 200 OK for /api/build_info endpoint.
     """
     if path == "/api/build_info":
-        health_response = {
-            "status": "ok",
-            "service": "tts-ws-groq-proxy-v2",
-            "version": "v2.0.0",
-            "protocol": "ServiceWithStartup"
-        }
-        
-        response_body = json.dumps(health_response).encode('utf-8')
-        response_headers = [
-            ("Content-Type", "application/json"),
-            ("Content-Length", str(len(response_body))),
-        ]
-        
         logger.debug("Health check: 200 OK")
-        return (200, response_headers, response_body)
+        return _HEALTH_RESPONSE
     
     # Reject non-health HTTP requests
     return None
@@ -395,6 +919,7 @@ async def health_check_handler(path, request_headers):
 async def main():
     """Start the TTS WebSocket bridge server."""
     tts_bridge = TTSBridge()
+    health_task: Optional[asyncio.Task] = None
     
     try:
         logger.info(f"Starting TTS Groq Bridge v2 on port {WS_PORT}")
@@ -402,6 +927,10 @@ async def main():
         logger.info(f"WebSocket endpoint: ws://localhost:{WS_PORT}/")
         logger.info(f"ServiceWithStartup protocol enabled")
         
+        # Open the Groq HTTP session once for the whole process lifetime
+        await tts_bridge.start_session()
+        health_task = asyncio.create_task(tts_bridge._health_loop())
+        
         # Start WebSocket server with health check support
         server = await websockets.serve(
             tts_bridge.handle_websocket_connection,
@@ -410,6 +939,12 @@ async def main():
             process_request=health_check_handler,  # Handle HTTP health checks
             ping_interval=20,
             ping_timeout=10,
+            # Bound per-connection memory: small inbound messages, short outbound queue
+            max_size=WS_MAX_MESSAGE_SIZE,
+            max_queue=WS_MAX_QUEUE,
+            write_limit=WS_WRITE_LIMIT,
+            # PCM doesn't deflate usefully; skip zlib on every audio frame
+            compression=None,
         )
         
         logger.info("TTS Bridge v2 server started successfully")
@@ -422,13 +957,19 @@ async def main():
         raise
     finally:
         # Cleanup
+        if health_task:
+            health_task.cancel()
         await tts_bridge.close_session()
         logger.info("TTS Bridge v2 server stopped")
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        if uvloop is not None:
+            logger.info("Using uvloop event loop")
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
@@ -32,26 +32,34 @@ class TTSBridgeTestSuite:
     def __init__(self):
         self.tests_passed = 0
         self.tests_failed = 0
+        self._session = None
+    
+    async def __aenter__(self):
+        # One HTTP session (and connection pool) shared by all HTTP tests
+        self._session = aiohttp.ClientSession()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self._session.close()
     
     async def test_health_endpoint(self):
         """Test 1: Health endpoint availability and response format."""
         logger.info("🧪 Test 1: Health endpoint")
         
         try:
-            async with aiohttp.ClientSession() as session:
-                url = f"http://{TTS_BRIDGE_HOST}:{TTS_BRIDGE_PORT}/api/build_info"
-                async with session.get(url, timeout=5) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if data.get("status") == "ok" and "tts" in data.get("service", "").lower():
-                            logger.info(f"✅ PASS Health Endpoint: {data}")
-                            self.tests_passed += 1
-                            return True
-                        else:
-                            logger.error(f"❌ FAIL Health endpoint returned invalid data: {data}")
+            url = f"http://{TTS_BRIDGE_HOST}:{TTS_BRIDGE_PORT}/api/build_info"
+            async with self._session.get(url, timeout=5) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    if data.get("status") == "ok" and "tts" in data.get("service", "").lower():
+                        logger.info(f"✅ PASS Health Endpoint: {data}")
+                        self.tests_passed += 1
+                        return True
                     else:
-                        logger.error(f"❌ FAIL Health endpoint returned {response.status}")
-                        
+                        logger.error(f"❌ FAIL Health endpoint returned invalid data: {data}")
+                else:
+                    logger.error(f"❌ FAIL Health endpoint returned {response.status}")
+                    
         except Exception as e:
             logger.error(f"❌ FAIL Health endpoint error: {e}")
         
@@ -63,32 +71,31 @@ class TTSBridgeTestSuite:
         logger.info("🧪 Test 2: Groq TTS API Direct")
         
         try:
-            async with aiohttp.ClientSession() as session:
-                url = "https://api.groq.com/openai/v1/audio/speech"
-                payload = {
-                    "model": "playai-tts",
-                    "input": "Test synthesis",
-                    "voice": "Ruby-PlayAI",
-                    "response_format": "mp3"
-                }
-                headers = {
-                    "Authorization": f"Bearer {GROQ_API_KEY}",
-                    "Content-Type": "application/json"
-                }
-                
-                async with session.post(url, json=payload, headers=headers, timeout=30) as response:
-                    if response.status == 200:
-                        audio_data = await response.read()
-                        if len(audio_data) > 0:
-                            logger.info(f"✅ PASS Groq TTS Direct: Generated {len(audio_data)} bytes audio")
-                            self.tests_passed += 1
-                            return True
-                        else:
-                            logger.error("❌ FAIL Groq TTS returned empty audio")
+            url = "https://api.groq.com/openai/v1/audio/speech"
+            payload = {
+                "model": "playai-tts",
+                "input": "Test synthesis",
+                "voice": "Ruby-PlayAI",
+                "response_format": "mp3"
+            }
+            headers = {
+                "Authorization": f"Bearer {GROQ_API_KEY}",
+                "Content-Type": "application/json"
+            }
+            
+            async with self._session.post(url, json=payload, headers=headers, timeout=30) as response:
+                if response.status == 200:
+                    audio_data = await response.read()
+                    if len(audio_data) > 0:
+                        logger.info(f"✅ PASS Groq TTS Direct: Generated {len(audio_data)} bytes audio")
+                        self.tests_passed += 1
+                        return True
                     else:
-                        error_text = await response.text()
-                        logger.error(f"❌ FAIL Groq TTS API {response.status}: {error_text}")
-                        
+                        logger.error("❌ FAIL Groq TTS returned empty audio")
+                else:
+                    error_text = await response.text()
+                    logger.error(f"❌ FAIL Groq TTS API {response.status}: {error_text}")
+                    
         except Exception as e:
             logger.error(f"❌ FAIL Groq TTS API error: {e}")
         
@@ -198,13 +205,12 @@ class TTSBridgeTestSuite:
 
 async def main():
     """Run TTS bridge test suite."""
-    test_suite = TTSBridgeTestSuite()
-    
     logger.info(f"Testing TTS bridge at {TTS_BRIDGE_HOST}:{TTS_BRIDGE_PORT}")
     logger.info("Waiting 5 seconds for service to be ready...")
     await asyncio.sleep(5)
     
-    success = await test_suite.run_all_tests()
+    async with TTSBridgeTestSuite() as test_suite:
+        success = await test_suite.run_all_tests()
     exit(0 if success else 1)
 
 
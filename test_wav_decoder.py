@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the incremental WAV decoder in bridge.py
+
+Feeds wave-generated files in 1-, 7- and 16384-byte chunks and checks the
+result against a one-shot decode and a numpy reference.
+Run with: python -m unittest test_wav_decoder
+"""
+
+import io
+import os
+import struct
+import unittest
+import wave
+
+import numpy as np
+
+# bridge.py refuses to import without an API key; no request is made here
+os.environ.setdefault("GROQ_API_KEY", "test")
+
+from bridge import TARGET_SR, WavStreamDecoder  # noqa: E402
+
+CHUNK_SIZES = (1, 7, 16384)
+
+
+def make_wav(sample_rate: int, n_channels: int, n_frames: int = 1200) -> bytes:
+    """Build a 16-bit PCM WAV with the stdlib wave module."""
+    t = np.arange(n_frames) / sample_rate
+    channels = [np.sin(2 * np.pi * (440 + 110 * c) * t) * (12000 - 3000 * c) for c in range(n_channels)]
+    frames = np.stack(channels, axis=1).astype('<i2')
+    bio = io.BytesIO()
+    with wave.open(bio, 'wb') as wf:
+        wf.setnchannels(n_channels)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes(frames.tobytes())
+    return bio.getvalue()
+
+
+def insert_chunk_before_data(wav: bytes, chunk_id: bytes, payload: bytes) -> bytes:
+    """Insert a RIFF chunk (word-padded) between the fmt and data chunks."""
+    data_at = wav.index(b"data")
+    chunk = struct.pack('<4sI', chunk_id, len(payload)) + payload + b"\0" * (len(payload) & 1)
+    out = wav[:data_at] + chunk + wav[data_at:]
+    return out[:4] + struct.pack('<I', len(out) - 8) + out[8:]
+
+
+def reference_decode(wav: bytes, target_sr: int = TARGET_SR) -> np.ndarray:
+    """Decode with wave and resample the whole signal at once."""
+    with wave.open(io.BytesIO(wav), 'rb') as wf:
+        n_channels = wf.getnchannels()
+        sample_rate = wf.getframerate()
+        frames = wf.readframes(wf.getnframes())
+    pcm = np.frombuffer(frames, dtype='<i2').reshape(-1, n_channels).mean(axis=1) / 32768.0
+    if sample_rate == target_sr:
+        return pcm.astype(np.float32)
+    step = sample_rate / target_sr
+    positions = step * np.arange(int((pcm.size - 1) // step) + 1)
+    return np.interp(positions, np.arange(pcm.size), pcm).astype(np.float32)
+
+
+def decode_in_chunks(data: bytes, chunk_size: int, **kwargs) -> np.ndarray:
+    """Feed data to a fresh decoder chunk_size bytes at a time."""
+    decoder = WavStreamDecoder(**kwargs)
+    parts = [decoder.feed(data[i:i + chunk_size]) for i in range(0, len(data), chunk_size)]
+    return np.concatenate(parts)
+
+
+class WavStreamDecoderTest(unittest.TestCase):
+    """WavStreamDecoder must not depend on how the stream is chunked."""
+
+    def assert_chunking_invariant(self, wav: bytes):
+        one_shot = decode_in_chunks(wav, len(wav))
+        np.testing.assert_allclose(one_shot, reference_decode(wav), atol=1e-5)
+        for chunk_size in CHUNK_SIZES:
+            with self.subTest(chunk_size=chunk_size):
+                chunked = decode_in_chunks(wav, chunk_size)
+                self.assertEqual(chunked.dtype, np.float32)
+                self.assertEqual(chunked.shape, one_shot.shape)
+                np.testing.assert_allclose(chunked, one_shot, atol=1e-5)
+
+    def test_mono_and_stereo_at_common_rates(self):
+        for n_channels in (1, 2):
+            for sample_rate in (24000, 48000, 22050):
+                with self.subTest(n_channels=n_channels, sample_rate=sample_rate):
+                    self.assert_chunking_invariant(make_wav(sample_rate, n_channels))
+
+    def test_list_chunk_before_data(self):
+        # Odd-sized payload also exercises the word-alignment padding
+        wav = insert_chunk_before_data(make_wav(48000, 1), b"LIST", b"INFOx")
+        self.assert_chunking_invariant(wav)
+
+    def test_non_riff_stream_without_raw_sample_rate(self):
+        raw = make_wav(24000, 1)[44:]
+        for chunk_size in CHUNK_SIZES:
+            with self.subTest(chunk_size=chunk_size):
+                with self.assertRaises(ValueError):
+                    decode_in_chunks(raw, chunk_size)
+
+    def test_non_riff_stream_with_raw_sample_rate(self):
+        wav = make_wav(48000, 1)
+        expected = decode_in_chunks(wav, len(wav))
+        for chunk_size in CHUNK_SIZES:
+            with self.subTest(chunk_size=chunk_size):
+                raw = decode_in_chunks(wav[44:], chunk_size, raw_sample_rate=48000)
+                np.testing.assert_allclose(raw, expected, atol=1e-5)
+
+    def test_non_pcm_format_rejected(self):
+        wav = bytearray(make_wav(24000, 1))
+        struct.pack_into('<H', wav, 20, 3)  # WAVE_FORMAT_IEEE_FLOAT
+        with self.assertRaises(ValueError):
+            WavStreamDecoder().feed(bytes(wav))
+
+
+if __name__ == "__main__":
+    unittest.main()